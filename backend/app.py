@@ -1,19 +1,10 @@
 # backend/app.py
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-import os, time, platform
-# app.py
-from flask import Flask
-from routes.loadout_routes import bp as loadout_bp   # <-- add this import
-
-def create_app():
-    app = Flask(__name__)
-    # ... your existing setup (CORS, auth, etc.)
-
-    app.register_blueprint(loadout_bp)               # <-- add this line
-
-    return app
+from typing import Dict, Optional
+import os, time, platform, hashlib, json
 
 # --------------------------------------------------
 # App
@@ -39,38 +30,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --------------------------------------------------
+# Errors
+#   - Unmatched paths (mostly bot scans) get a pre-encoded 404 body;
+#     anything carrying its own detail/headers takes the stock handler.
+# --------------------------------------------------
+_NOT_FOUND_BODY = json.dumps({"detail": "Not Found"}, separators=(",", ":")).encode()
+
+@app.exception_handler(404)
+async def not_found(request: Request, exc):
+    if exc.detail == "Not Found" and not exc.headers:
+        return Response(_NOT_FOUND_BODY, status_code=404, media_type="application/json")
+    return await http_exception_handler(request, exc)
+
 # --------------------------------------------------
 # Models
 # --------------------------------------------------
 class EchoIn(BaseModel):
     msg: str
 
+class EchoOut(BaseModel):
+    msg: str
+    client: Optional[str]
+    server: str
+
+class TimeOut(BaseModel):
+    epoch_ms: int
+
 # --------------------------------------------------
 # Routes
 # --------------------------------------------------
+_ROOT_BODY = json.dumps({"ok": True, "service": "friday-backend"}, separators=(",", ":")).encode()
+_HEALTH_BODY = json.dumps({"ok": True}, separators=(",", ":")).encode()
+
+# health probes: async so they run on the event loop, not via the threadpool
+@app.get("/")
+async def root(): return Response(_ROOT_BODY, media_type="application/json")
+
 @app.get("/api/health")
-def health():
-    return {"ok": True}
+async def health():
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 @app.get("/api/time")
-def server_time():
-    return {"epoch_ms": int(time.time() * 1000)}
+def server_time() -> TimeOut:
+    return TimeOut(epoch_ms=time.time_ns() // 1_000_000)
+
+# value mirrors FastAPI app.version (from RELEASE env); fixed for the process
+# lifetime, so encode it once and let clients revalidate with the ETag
+_VERSION_BODY = json.dumps({"version": app.version}, separators=(",", ":")).encode()
+_VERSION_HEADERS = {
+    "ETag": '"%s"' % hashlib.blake2b(_VERSION_BODY, digest_size=8).hexdigest(),
+    "Cache-Control": "public, max-age=10",
+}
+
+def _etag_matches(header, etag):
+    # If-None-Match uses weak comparison: "*", lists, and W/ tags all count
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
 
 @app.get("/api/version")
-def version():
-    # value mirrors FastAPI app.version (from RELEASE env)
-    return {"version": app.version}
+async def version(request: Request):
+    if _etag_matches(request.headers.get("if-none-match", ""), _VERSION_HEADERS["ETag"]):
+        return Response(status_code=304, headers=_VERSION_HEADERS)
+    return Response(_VERSION_BODY, media_type="application/json", headers=_VERSION_HEADERS)
 
 @app.post("/api/echo")
-def echo(body: EchoIn, request: Request):
-    return {
-        "msg": body.msg,
-        "client": request.client.host if request.client else None,
-        "server": platform.node(),
-    }
+def echo(body: EchoIn, request: Request) -> EchoOut:
+    return EchoOut(
+        msg=body.msg,
+        client=request.client.host if request.client else None,
+        server=platform.node(),
+    )
 
 @app.get("/api/env")
-def env():
+def env() -> Dict[str, Optional[str]]:
     # Handy debug endpoint (remove or protect later)
     keys = ["ENV", "RELEASE", "FRONTEND_ORIGIN", "PORT"]
     return {k: os.getenv(k) for k in keys}
@@ -83,31 +121,3 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=int(os.getenv("PORT", "8000")),
     )
-
-
-@app.get("/api/health")
-def health():
-    return {"ok": True}
-
-@app.get("/api/time")
-def server_time():
-    return {"epoch_ms": int(time.time() * 1000)}
-
-@app.get("/api/version")
-def version():
-    return {"version": app.version}
-
-class EchoIn(BaseModel):
-    msg: str
-
-@app.get("/")
-def root(): return {"ok": True, "service": "friday-backend"}
-
-@app.post("/api/echo")
-def echo(body: EchoIn, request: Request):
-    return {
-        "msg": body.msg,
-        "client": request.client.host if request.client else None,
-        "server": platform.node(),
-    }
-